@@ -11,9 +11,9 @@ Usage:
 
 import json
 import csv
-import os
 import sys
 import argparse
+import itertools
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
@@ -138,7 +138,7 @@ class UE5Exporter:
 
         # Export world bosses
         boss_rows = []
-        for boss in data.get('worldBosses', []) + data.get('dungeonBosses', []):
+        for boss in itertools.chain(data.get('worldBosses', []), data.get('dungeonBosses', [])):
             row = {
                 'RowName': boss.get('id', ''),
                 'Name': boss.get('name', ''),
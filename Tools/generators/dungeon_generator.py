@@ -37,6 +37,10 @@ class TileType(Enum):
     STAIRS_DOWN = "stairs_down"
 
 
+# Export names per tile, so the grid dump skips the Enum.value lookup
+TILE_VALUES = {tile: tile.value for tile in TileType}
+
+
 @dataclass
 class Room:
     id: int
@@ -151,9 +155,9 @@ class DungeonGenerator:
 
     def _carve_room(self, room: Room):
         """Carve out a room in the grid."""
+        floor_span = [TileType.FLOOR] * room.width
         for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                self.grid[y][x] = TileType.FLOOR
+            self.grid[y][room.x:room.x + room.width] = floor_span
 
     def _connect_rooms(self):
         """Connect rooms with corridors using minimum spanning tree."""
@@ -163,13 +167,18 @@ class DungeonGenerator:
         connected: Set[int] = {0}
         unconnected: Set[int] = set(range(1, len(self.rooms)))
 
+        # Room centers never move, so compute every pairwise distance once
+        distances = [[self._room_distance(r1, r2) for r2 in self.rooms]
+                     for r1 in self.rooms]
+
         while unconnected:
             best_dist = float('inf')
             best_pair = (0, 1)
 
             for c in connected:
+                row = distances[c]
                 for u in unconnected:
-                    dist = self._room_distance(self.rooms[c], self.rooms[u])
+                    dist = row[u]
                     if dist < best_dist:
                         best_dist = dist
                         best_pair = (c, u)
@@ -212,15 +221,19 @@ class DungeonGenerator:
 
     def _carve_h_corridor(self, x1: int, x2: int, y: int):
         """Carve a horizontal corridor."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < self.config.width and 0 <= y < self.config.height:
-                self.grid[y][x] = TileType.FLOOR
+        if not 0 <= y < self.config.height:
+            return
+        start = max(min(x1, x2), 0)
+        end = min(max(x1, x2), self.config.width - 1)
+        if start <= end:
+            self.grid[y][start:end + 1] = [TileType.FLOOR] * (end - start + 1)
 
     def _carve_v_corridor(self, y1: int, y2: int, x: int):
         """Carve a vertical corridor."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x < self.config.width and 0 <= y < self.config.height:
-                self.grid[y][x] = TileType.FLOOR
+        if not 0 <= x < self.config.width:
+            return
+        for y in range(max(min(y1, y2), 0), min(max(y1, y2), self.config.height - 1) + 1):
+            self.grid[y][x] = TileType.FLOOR
 
     def _place_special_rooms(self):
         """Designate entrance and boss rooms."""
@@ -239,20 +252,23 @@ class DungeonGenerator:
 
     def _populate_rooms(self):
         """Add encounters and loot to rooms."""
+        # Cumulative roll thresholds for each room type
+        combat_cutoff = self.config.combat_room_chance
+        puzzle_cutoff = combat_cutoff + self.config.puzzle_room_chance
+        treasure_cutoff = puzzle_cutoff + self.config.treasure_room_chance
+
         for room in self.rooms:
             if room.room_type in (RoomType.ENTRANCE, RoomType.BOSS):
                 continue
 
             roll = random.random()
-            if roll < self.config.combat_room_chance:
+            if roll < combat_cutoff:
                 room.room_type = RoomType.COMBAT
                 room.encounters = self._generate_encounters(room)
-            elif roll < self.config.combat_room_chance + self.config.puzzle_room_chance:
+            elif roll < puzzle_cutoff:
                 room.room_type = RoomType.PUZZLE
                 room.puzzle = self._generate_puzzle()
-            elif roll < (self.config.combat_room_chance +
-                        self.config.puzzle_room_chance +
-                        self.config.treasure_room_chance):
+            elif roll < treasure_cutoff:
                 room.room_type = RoomType.TREASURE
                 room.loot = self._generate_loot(room, bonus=True)
             else:
@@ -337,11 +353,10 @@ class DungeonGenerator:
 
     def _add_traps(self):
         """Add traps to the dungeon."""
-        floor_tiles = []
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                if self.grid[y][x] == TileType.FLOOR:
-                    floor_tiles.append((x, y))
+        floor_tiles = [(x, y)
+                       for y, row in enumerate(self.grid)
+                       for x, tile in enumerate(row)
+                       if tile is TileType.FLOOR]
 
         num_traps = int(len(floor_tiles) * self.config.trap_density)
         trap_tiles = random.sample(floor_tiles, min(num_traps, len(floor_tiles)))
@@ -415,7 +430,7 @@ class DungeonGenerator:
                 for room in self.rooms
             ],
             "grid": [
-                [tile.value for tile in row]
+                [TILE_VALUES[tile] for tile in row]
                 for row in self.grid
             ],
             "required_skills": self.config.required_skills
@@ -424,15 +439,14 @@ class DungeonGenerator:
 
 def generate_dungeon(config_path: Path, output_path: Path, seed: Optional[int] = None):
     """Generate a dungeon from a config file."""
-    with open(config_path) as f:
-        config_data = json.load(f)
+    config_data = json.loads(config_path.read_bytes())
 
     config = DungeonConfig(**config_data)
     generator = DungeonGenerator(config, seed)
     dungeon = generator.generate()
 
     with open(output_path, 'w') as f:
-        json.dump(dungeon, f, indent=2)
+        f.write(json.dumps(dungeon, indent=2))
 
     return dungeon
 
@@ -477,7 +491,7 @@ def main():
         dungeon = generator.generate()
 
         with open(args.output, 'w') as f:
-            json.dump(dungeon, f, indent=2)
+            f.write(json.dumps(dungeon, indent=2))
 
     print(f"Generated dungeon with {len(dungeon['rooms'])} rooms")
     print(f"Seed: {dungeon['metadata']['seed']}")
@@ -5,8 +5,6 @@ Generates balanced loot tables for monsters, bosses, and activities.
 """
 
 import json
-import random
-import math
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Dict, Optional, Tuple
@@ -109,6 +107,21 @@ class LootTableGenerator:
         {"item_id": "uncut_dragonstone", "rate": DropRate(1, 256)}
     ]
 
+    # (minimum combat level, clue scroll, rate) tertiary drops
+    CLUE_SCROLL_DROPS = (
+        (10, "clue_scroll_easy", "1/128"),
+        (40, "clue_scroll_medium", "1/256"),
+        (80, "clue_scroll_hard", "1/512"),
+        (150, "clue_scroll_elite", "1/1000"),
+    )
+
+    # (minimum combat level, bones) checked highest first; "bones" otherwise
+    BONES_BY_LEVEL = (
+        (200, "superior_dragon_bones"),
+        (100, "dragon_bones"),
+        (50, "big_bones"),
+    )
+
     def __init__(self, config: LootTableConfig):
         self.config = config
 
@@ -154,14 +167,12 @@ class LootTableGenerator:
 
         # Add bones based on combat level if not specified
         if not any(d.get("item_id", "").endswith("bones") for d in drops):
-            if self.config.combat_level >= 200:
-                drops.append({"item_id": "superior_dragon_bones", "quantity": 1, "rate": "1/1"})
-            elif self.config.combat_level >= 100:
-                drops.append({"item_id": "dragon_bones", "quantity": 1, "rate": "1/1"})
-            elif self.config.combat_level >= 50:
-                drops.append({"item_id": "big_bones", "quantity": 1, "rate": "1/1"})
-            else:
-                drops.append({"item_id": "bones", "quantity": 1, "rate": "1/1"})
+            bones = next(
+                (item_id for min_level, item_id in self.BONES_BY_LEVEL
+                 if self.config.combat_level >= min_level),
+                "bones"
+            )
+            drops.append({"item_id": bones, "quantity": 1, "rate": "1/1"})
 
         return drops
 
@@ -172,12 +183,14 @@ class LootTableGenerator:
         # Use configured main drops
         for drop in self.config.main_drops:
             rate = drop.get("rate", {"num": 1, "denom": 10})
+            num = rate.get("num", 1)
+            denom = rate.get("denom", 10)
             drops.append({
                 "item_id": drop.get("item_id"),
                 "quantity_min": drop.get("quantity_min", 1),
                 "quantity_max": drop.get("quantity_max", 1),
-                "rate": f"{rate.get('num', 1)}/{rate.get('denom', 10)}",
-                "rarity": self._classify_rarity(rate.get("num", 1), rate.get("denom", 10))
+                "rate": f"{num}/{denom}",
+                "rarity": self._classify_rarity(num, denom)
             })
 
         # Auto-generate additional drops based on combat level
@@ -241,11 +254,13 @@ class LootTableGenerator:
 
         for unique in self.config.unique_drops:
             rate = unique.get("rate", {"num": 1, "denom": 512})
+            num = rate.get("num", 1)
+            denom = rate.get("denom", 512)
             drops.append({
                 "item_id": unique.get("item_id"),
                 "quantity": unique.get("quantity", 1),
-                "rate": f"{rate.get('num', 1)}/{rate.get('denom', 512)}",
-                "rarity": self._classify_rarity(rate.get("num", 1), rate.get("denom", 512)),
+                "rate": f"{num}/{denom}",
+                "rarity": self._classify_rarity(num, denom),
                 "broadcast": unique.get("broadcast", True),
                 "collection_log": True
             })
@@ -267,34 +282,14 @@ class LootTableGenerator:
             })
 
         # Auto-add clue scrolls based on combat level
-        if self.config.combat_level >= 10:
-            drops.append({
-                "item_id": "clue_scroll_easy",
-                "quantity": 1,
-                "rate": "1/128",
-                "tertiary": True
-            })
-        if self.config.combat_level >= 40:
-            drops.append({
-                "item_id": "clue_scroll_medium",
-                "quantity": 1,
-                "rate": "1/256",
-                "tertiary": True
-            })
-        if self.config.combat_level >= 80:
-            drops.append({
-                "item_id": "clue_scroll_hard",
-                "quantity": 1,
-                "rate": "1/512",
-                "tertiary": True
-            })
-        if self.config.combat_level >= 150:
-            drops.append({
-                "item_id": "clue_scroll_elite",
-                "quantity": 1,
-                "rate": "1/1000",
-                "tertiary": True
-            })
+        for min_level, item_id, rate in self.CLUE_SCROLL_DROPS:
+            if self.config.combat_level >= min_level:
+                drops.append({
+                    "item_id": item_id,
+                    "quantity": 1,
+                    "rate": rate,
+                    "tertiary": True
+                })
 
         return drops
 
@@ -343,26 +338,28 @@ class LootTableGenerator:
         else:
             return "legendary"
 
+    @staticmethod
+    def _parse_rate(rate_str: str) -> float:
+        """Convert a "num/denom" rate string to a probability."""
+        parts = rate_str.split("/")
+        return int(parts[0]) / int(parts[1])
+
     def _calculate_statistics(self, table: Dict) -> Dict:
         """Calculate statistics about the loot table."""
-        def parse_rate(rate_str: str) -> float:
-            parts = rate_str.split("/")
-            return int(parts[0]) / int(parts[1])
-
         total_value = 0
         unique_count = len(table.get("unique_table", []))
         main_count = len(table.get("main_table", []))
 
         # Expected drops per kill
         expected_drops = sum(
-            parse_rate(drop.get("rate", "1/1"))
+            self._parse_rate(drop.get("rate", "1/1"))
             for drop in table.get("main_table", [])
         )
 
         # Unique dry rate (kills to expect all uniques)
         if unique_count > 0:
             unique_rates = [
-                1 / parse_rate(drop.get("rate", "1/512"))
+                1 / self._parse_rate(drop.get("rate", "1/512"))
                 for drop in table.get("unique_table", [])
             ]
             avg_dry_rate = sum(unique_rates) / len(unique_rates)
@@ -381,15 +378,14 @@ class LootTableGenerator:
 
 def generate_loot_table(config_path: Path, output_path: Path) -> Dict:
     """Generate a loot table from configuration file."""
-    with open(config_path) as f:
-        config_data = json.load(f)
+    config_data = json.loads(config_path.read_bytes())
 
     config = LootTableConfig(**config_data)
     generator = LootTableGenerator(config)
     table = generator.generate()
 
     with open(output_path, 'w') as f:
-        json.dump(table, f, indent=2)
+        f.write(json.dumps(table, indent=2))
 
     return table
 
@@ -429,7 +425,7 @@ def main():
         table = generator.generate()
 
         with open(args.output, 'w') as f:
-            json.dump(table, f, indent=2)
+            f.write(json.dumps(table, indent=2))
 
     print(f"Generated loot table for: {table['metadata']['source_id']}")
     print(f"Output: {args.output}")
@@ -14,9 +14,9 @@ Usage:
 """
 
 import json
-import os
 import sys
 import argparse
+import itertools
 from pathlib import Path
 from typing import Dict, List, Set, Any, Optional, Tuple
 from dataclasses import dataclass, field
@@ -54,6 +54,20 @@ class ValidationReport:
 class GameDataValidator:
     """Validates all game data files for consistency and correctness."""
 
+    # Fixed lookup tables shared by every validation pass
+    BASE_SKILLS = (
+        'melee', 'ranged', 'magic', 'defense', 'hitpoints', 'prayer',
+        'mining', 'smithing', 'woodcutting', 'firemaking', 'fishing',
+        'cooking', 'farming', 'herblore', 'fletching', 'crafting',
+        'runecrafting', 'construction', 'agility', 'thieving', 'beastslaying',
+        'summoning', 'dungeoneering', 'divination', 'invention'
+    )
+    ABILITY_CATEGORIES = ('melee', 'ranged', 'magic', 'defense', 'prayer')
+    ITEM_REQUIRED_FIELDS = ('id', 'name', 'type')
+    ENEMY_REQUIRED_FIELDS = ('id', 'name', 'level', 'health')
+    ENEMY_DROP_TYPES = ('mainDrops', 'uncommonDrops', 'rareDrops')
+    BOSS_DROP_TYPES = ('guaranteedDrops', 'commonDrops', 'rareDrops', 'ultraRareDrops')
+
     def __init__(self, data_path: str):
         self.data_path = Path(data_path)
         self.report = ValidationReport()
@@ -154,7 +168,7 @@ class GameDataValidator:
             data = self.load_json(abilities_file)
             if data:
                 self.data['abilities'] = data
-                for category in ['melee', 'ranged', 'magic', 'defense', 'prayer']:
+                for category in self.ABILITY_CATEGORIES:
                     for ability in data.get(category, []):
                         self.ability_ids.add(ability.get('id', ''))
 
@@ -194,13 +208,7 @@ class GameDataValidator:
                                         self.skill_names.add(recipe['skill'])
 
         # Define valid skills
-        self.skill_names.update([
-            'melee', 'ranged', 'magic', 'defense', 'hitpoints', 'prayer',
-            'mining', 'smithing', 'woodcutting', 'firemaking', 'fishing',
-            'cooking', 'farming', 'herblore', 'fletching', 'crafting',
-            'runecrafting', 'construction', 'agility', 'thieving', 'beastslaying',
-            'summoning', 'dungeoneering', 'divination', 'invention'
-        ])
+        self.skill_names.update(self.BASE_SKILLS)
 
     def validate_items(self):
         """Validate items.json structure and references."""
@@ -210,6 +218,8 @@ class GameDataValidator:
         items = self.data['items']
         file_path = "Data/Items/items.json"
         seen_ids = set()
+        # Skill names are fixed after collect_ids(), so render the hint once
+        valid_skills_hint = f"Valid skills: {', '.join(sorted(self.skill_names))}"
 
         for idx, item in enumerate(items.get('items', [])):
             item_id = item.get('id', '')
@@ -225,8 +235,7 @@ class GameDataValidator:
             seen_ids.add(item_id)
 
             # Required fields
-            required = ['id', 'name', 'type']
-            for field in required:
+            for field in self.ITEM_REQUIRED_FIELDS:
                 if field not in item:
                     self.report.add(ValidationResult(
                         file=file_path,
@@ -245,7 +254,7 @@ class GameDataValidator:
                             message=f"Unknown skill '{skill}' in requirements",
                             severity=Severity.WARNING,
                             path=f"items[{idx}].requirements",
-                            suggestion=f"Valid skills: {', '.join(sorted(self.skill_names))}"
+                            suggestion=valid_skills_hint
                         ))
                     if not isinstance(level, int) or level < 1 or level > 120:
                         self.report.add(ValidationResult(
@@ -264,9 +273,9 @@ class GameDataValidator:
         file_path = "Data/Npcs/enemies.json"
         seen_ids = set()
 
-        all_enemies = (
-            enemies_data.get('enemies', []) +
-            enemies_data.get('worldBosses', []) +
+        all_enemies = itertools.chain(
+            enemies_data.get('enemies', []),
+            enemies_data.get('worldBosses', []),
             enemies_data.get('dungeonBosses', [])
         )
 
@@ -284,8 +293,7 @@ class GameDataValidator:
             seen_ids.add(enemy_id)
 
             # Required fields
-            required = ['id', 'name', 'level', 'health']
-            for field in required:
+            for field in self.ENEMY_REQUIRED_FIELDS:
                 if field not in enemy:
                     self.report.add(ValidationResult(
                         file=file_path,
@@ -340,27 +348,26 @@ class GameDataValidator:
 
         # Check enemy loot tables
         for table_name, table in loot_data.get('enemyLootTables', {}).items():
-            for drop_type in ['mainDrops', 'uncommonDrops', 'rareDrops']:
+            for drop_type in self.ENEMY_DROP_TYPES:
                 for idx, drop in enumerate(table.get(drop_type, [])):
                     if 'itemId' in drop:
                         check_item_ref(drop['itemId'], f"enemyLootTables.{table_name}.{drop_type}[{idx}]")
 
         # Check boss loot tables
         for table_name, table in loot_data.get('bossLootTables', {}).items():
-            for drop_type in ['guaranteedDrops', 'commonDrops', 'rareDrops', 'ultraRareDrops']:
+            for drop_type in self.BOSS_DROP_TYPES:
                 for idx, drop in enumerate(table.get(drop_type, [])):
                     if 'itemId' in drop:
                         check_item_ref(drop['itemId'], f"bossLootTables.{table_name}.{drop_type}[{idx}]")
 
     def validate_recipes(self):
         """Validate all recipe files."""
-        recipes_path = self.data_path / "Recipes"
-        if not recipes_path.exists():
-            return
-
-        for recipe_file in recipes_path.glob("*.json"):
-            file_path = f"Data/Recipes/{recipe_file.name}"
-            data = self.data.get(f'recipes_{recipe_file.stem}', {})
+        # Recipe files were already loaded by collect_ids(); reuse them
+        # instead of globbing the directory again
+        for data_key, data in self.data.items():
+            if not data_key.startswith('recipes_'):
+                continue
+            file_path = f"Data/Recipes/{data_key[len('recipes_'):]}.json"
 
             for category, recipes in data.items():
                 if not isinstance(recipes, list):
@@ -562,9 +569,12 @@ class GameDataValidator:
 
     def print_report(self, verbose: bool = False):
         """Print the validation report."""
-        errors = [r for r in self.report.results if r.severity == Severity.ERROR]
-        warnings = [r for r in self.report.results if r.severity == Severity.WARNING]
-        infos = [r for r in self.report.results if r.severity == Severity.INFO]
+        by_severity = {severity: [] for severity in Severity}
+        for result in self.report.results:
+            by_severity[result.severity].append(result)
+        errors = by_severity[Severity.ERROR]
+        warnings = by_severity[Severity.WARNING]
+        infos = by_severity[Severity.INFO]
 
         print("\n" + "=" * 60)
         print("VALIDATION REPORT")
@@ -5,9 +5,8 @@ Validates all JSON data files against their schemas and cross-references.
 """
 
 import json
-import os
 import sys
-import re
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
@@ -20,6 +19,14 @@ class Severity(Enum):
     INFO = "INFO"
 
 
+# Colored console labels, looked up per printed result
+SEVERITY_PREFIXES = {
+    Severity.ERROR: "\033[91mERROR\033[0m",
+    Severity.WARNING: "\033[93mWARNING\033[0m",
+    Severity.INFO: "\033[94mINFO\033[0m"
+}
+
+
 @dataclass
 class ValidationResult:
     file: str
@@ -32,6 +39,29 @@ class ValidationResult:
 class GameDataValidator:
     """Validates game data files for consistency and correctness."""
 
+    # Allowed values, built once rather than on every check
+    VALID_SKILLS = frozenset({
+        "attack", "strength", "defence", "ranged", "prayer", "magic",
+        "hitpoints", "crafting", "mining", "smithing", "fishing", "cooking",
+        "firemaking", "woodcutting", "runecrafting", "slayer", "farming",
+        "construction", "hunter", "summoning", "dungeoneering", "divination",
+        "invention", "archaeology", "agility", "herblore", "thieving", "fletching"
+    })
+
+    VALID_EQUIPMENT_SLOTS = frozenset({
+        "head", "cape", "neck", "ammo", "weapon", "shield",
+        "body", "legs", "hands", "feet", "ring", "two_handed"
+    })
+
+    VALID_DIFFICULTIES = frozenset({
+        "novice", "intermediate", "experienced", "master", "grandmaster"
+    })
+
+    VALID_BIOMES = frozenset({
+        "temperate", "forest", "desert", "arctic", "swamp",
+        "jungle", "volcanic", "coastal", "mountain", "plains"
+    })
+
     def __init__(self, data_root: Path):
         self.data_root = data_root
         self.results: List[ValidationResult] = []
@@ -108,14 +138,7 @@ class GameDataValidator:
 
     def validate_skill_reference(self, skill_name: str, file: str, path: str):
         """Validate that a skill name is valid."""
-        valid_skills = {
-            "attack", "strength", "defence", "ranged", "prayer", "magic",
-            "hitpoints", "crafting", "mining", "smithing", "fishing", "cooking",
-            "firemaking", "woodcutting", "runecrafting", "slayer", "farming",
-            "construction", "hunter", "summoning", "dungeoneering", "divination",
-            "invention", "archaeology", "agility", "herblore", "thieving", "fletching"
-        }
-        if skill_name.lower() not in valid_skills:
+        if skill_name.lower() not in self.VALID_SKILLS:
             self.add_error(file, f"Invalid skill reference: {skill_name}", path)
 
     def validate_items_file(self, filepath: Path) -> bool:
@@ -143,9 +166,7 @@ class GameDataValidator:
             if "equipment" in item:
                 equip = item["equipment"]
                 if "slot" in equip:
-                    valid_slots = {"head", "cape", "neck", "ammo", "weapon", "shield",
-                                   "body", "legs", "hands", "feet", "ring", "two_handed"}
-                    if equip["slot"] not in valid_slots:
+                    if equip["slot"] not in self.VALID_EQUIPMENT_SLOTS:
                         self.add_error(file, f"Invalid equipment slot: {equip['slot']}", f"{path}.equipment.slot")
 
                 # Validate stat bonuses
@@ -252,8 +273,7 @@ class GameDataValidator:
 
             # Validate difficulty
             if "difficulty" in quest:
-                valid_difficulties = {"novice", "intermediate", "experienced", "master", "grandmaster"}
-                if quest["difficulty"].lower() not in valid_difficulties:
+                if quest["difficulty"].lower() not in self.VALID_DIFFICULTIES:
                     self.add_error(file, f"Invalid difficulty: {quest['difficulty']}", f"{path}.difficulty")
 
             # Validate quest points
@@ -299,9 +319,7 @@ class GameDataValidator:
 
             # Validate biome if present
             if "biome" in region:
-                valid_biomes = {"temperate", "forest", "desert", "arctic", "swamp",
-                               "jungle", "volcanic", "coastal", "mountain", "plains"}
-                if region["biome"].lower() not in valid_biomes:
+                if region["biome"].lower() not in self.VALID_BIOMES:
                     self.add_warning(file, f"Unknown biome: {region['biome']}", f"{path}.biome")
 
         self.add_info(file, f"Validated {len(data.get('regions', []))} regions")
@@ -437,20 +455,14 @@ class GameDataValidator:
         self.cross_validate()
 
         # Count results
-        errors = sum(1 for r in self.results if r.severity == Severity.ERROR)
-        warnings = sum(1 for r in self.results if r.severity == Severity.WARNING)
-        info = sum(1 for r in self.results if r.severity == Severity.INFO)
+        counts = Counter(r.severity for r in self.results)
 
-        return errors, warnings, info
+        return counts[Severity.ERROR], counts[Severity.WARNING], counts[Severity.INFO]
 
     def print_results(self):
         """Print validation results to console."""
         for result in self.results:
-            prefix = {
-                Severity.ERROR: "\033[91mERROR\033[0m",
-                Severity.WARNING: "\033[93mWARNING\033[0m",
-                Severity.INFO: "\033[94mINFO\033[0m"
-            }[result.severity]
+            prefix = SEVERITY_PREFIXES[result.severity]
 
             location = result.file
             if result.path: